@@ -1,20 +1,18 @@
 import logging
-import os
 from os.path import dirname, join, pardir
+from pathlib import Path
 
 PROJECT_DIR = dirname(__file__)
 RESOURCE_DIR = join(pardir, 'resources')
 DATA_DIR = join(RESOURCE_DIR, 'data')
 TEST_DATA_DIR = join(pardir, 'tests', 'sample_data', 'csv')
 
+# DATA_DIR is inside RESOURCE_DIR so this creates both.
 try:
-    os.makedirs(RESOURCE_DIR)
-except OSError:
-    pass
-
-try:
-    os.makedirs(DATA_DIR)
+    Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
 except OSError:
+    # not being able to create the dirs should not stop pytech from
+    # being imported.
     pass
 
 logging.basicConfig(level=logging.DEBUG)
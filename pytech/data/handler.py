@@ -2,6 +2,7 @@ import datetime as dt
 import logging
 import queue
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Iterable, Union
 
 import numpy as np
@@ -132,6 +133,13 @@ class Bars(DataHandler):
         self.source = source
         super().__init__(events, tickers, start_date, end_date,
                          asset_lib_name, market_lib_name)
+        # key=ticker, value=2-D array of every bar's numeric columns.
+        self._bar_arrays = {}
+        # key=ticker, value=row in ``_bar_arrays`` of the latest bar.
+        self._cursors = {}
+        # key=ticker, value=dict of column name to column index in that
+        # ticker's ``_bar_arrays``.
+        self._bar_cols = {}
 
     def _populate_ticker_data(self) -> Dict[str, Iterable[pd.Series]]:
         """
@@ -153,6 +161,12 @@ class Bars(DataHandler):
 
             self.latest_ticker_data[t] = []
 
+            num_df = out[t].select_dtypes(include=[np.number])
+            self._bar_arrays[t] = num_df.values.astype(np.float64)
+            self._bar_cols[t] = {col: i
+                                 for i, col in enumerate(num_df.columns)}
+            self._cursors[t] = -1
+
         for t in self.tickers:
             out[t] = out[t].iterrows()
             # self.ticker_data[t] = (self.ticker_data[t].iterrows())
@@ -172,17 +186,29 @@ class Bars(DataHandler):
         market. If None is passed then no market_ticker will be used.
         :return: The aggregate data frame.
         """
-        agg_df = pd.DataFrame()
+        agg_cols = OrderedDict()
         df_dict = self._get_data()
 
         if market_ticker is not None and market_ticker not in self.tickers:
             # get the market data if it has not already been fetched
             market_df = self.market_reader.get_data(market_ticker, columns=col)
-            agg_df[market_ticker] = market_df[col]
+            agg_cols[market_ticker] = market_df[col]
 
         for t in self.tickers:
             temp_df = df_dict[t]
-            agg_df[t] = temp_df[col]
+            agg_cols[t] = temp_df[col]
+
+        if not agg_cols:
+            return pd.DataFrame()
+
+        # build the df in one go and align it to the first column's index
+        # instead of reindexing the whole df every time a column is added.
+        first_index = next(iter(agg_cols.values())).index
+        agg_df = (pd.DataFrame(agg_cols, columns=list(agg_cols))
+                  .reindex(first_index))
+
+        if col != utils.VOL_COL:
+            agg_df = agg_df.astype(np.float32)
 
         return agg_df
 
@@ -264,6 +290,11 @@ class Bars(DataHandler):
         Get the last ``n`` bars but return a series containing only the
         ``val_type`` requested.
 
+        The values are copied straight from the ticker's bar array rather than
+        read from the :class:`pd.Series` in ``latest_ticker_data``, so
+        changing them does not change the stored bars. Nothing is returned
+        before the first call to :func:`update_bars`.
+
         :param str ticker: The ticker of the asset for which the bars are
         needed.
         :param val_type:
@@ -271,13 +302,15 @@ class Bars(DataHandler):
         :return:
         """
         try:
-            bars_list = self.get_latest_bars(ticker, n)
+            cursor = self._cursors[ticker]
         except KeyError:
             self.logger.exception(
                     f'Could not find {ticker} in latest_ticker_data')
             raise
         else:
-            return np.array([getattr(bar, val_type) for bar in bars_list])
+            start = max(cursor - n + 1, 0)
+            col = self._bar_cols[ticker][val_type]
+            return self._bar_arrays[ticker][start:cursor + 1, col].copy()
 
     def update_bars(self):
         for ticker in self.tickers:
@@ -290,5 +323,6 @@ class Bars(DataHandler):
             else:
                 if bar is not None:
                     self.latest_ticker_data[ticker].append(bar)
+                    self._cursors[ticker] += 1
 
         self.events.put(MarketEvent())
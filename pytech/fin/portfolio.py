@@ -10,7 +10,7 @@ import pytech.utils.dt_utils as dt_utils
 from pytech.backtest.event import SignalEvent
 from pytech.data.handler import DataHandler
 from pytech.fin.asset.owned_asset import OwnedAsset
-from pytech.mongo import ARCTIC_STORE, PortfolioStore
+from pytech.mongo import ARCTIC_STORE, PortfolioStore, init_db
 from pytech.trading.blotter import Blotter
 from pytech.trading.trade import Trade
 from pytech.utils import pandas_utils as pd_utils
@@ -72,7 +72,8 @@ class AbstractPortfolio(metaclass=ABCMeta):
         # positions = qty
         self.all_positions_qty = self._construct_all_positions()
         self.total_commission = 0.0
-        self.lib = ARCTIC_STORE['pytech.portfolio']
+        init_db()
+        self.lib = ARCTIC_STORE[PortfolioStore.LIBRARY_NAME]
         self.positions_df = pd.DataFrame()
         self.raise_on_warnings = raise_on_warnings
 
@@ -11,6 +11,17 @@ ARCTIC_STORE = Arctic(client)
 register_library_type(BarStore.LIBRARY_TYPE, BarStore)
 register_library_type(PortfolioStore.LIBRARY_TYPE, PortfolioStore)
 
-ARCTIC_STORE.initialize_library(BarStore.LIBRARY_NAME, BarStore.LIBRARY_TYPE)
-ARCTIC_STORE.initialize_library(PortfolioStore.LIBRARY_NAME,
-                                PortfolioStore.LIBRARY_TYPE)
+
+def init_db():
+    """
+    Initialize the libraries that pytech requires.
+
+    Only libraries that do not already exist are created so this is safe to
+    call more than once.
+    """
+    existing_libs = ARCTIC_STORE.list_libraries()
+
+    for store in (BarStore, PortfolioStore):
+        if store.LIBRARY_NAME not in existing_libs:
+            ARCTIC_STORE.initialize_library(store.LIBRARY_NAME,
+                                            store.LIBRARY_TYPE)
@@ -0,0 +1,235 @@
+"""
+Struct of arrays storage for the trigger prices of open orders.
+
+The :class:`pytech.trading.blotter.Blotter` keeps one
+:class:`TriggerArrays` per ticker so that finding the orders that a new
+price could trigger is a few vectorized comparisons rather than a
+``check_triggers`` call on every open order.
+
+If numba is installed the comparisons are compiled into a single loop.
+"""
+from typing import List
+
+import numpy as np
+
+from pytech.utils.enums import OrderType, TradeAction
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _eval_triggers_vectorized(stop: np.ndarray,
+                              limit: np.ndarray,
+                              buy: np.ndarray,
+                              open_mask: np.ndarray,
+                              price: float) -> np.ndarray:
+    """
+    Find the orders whose stop or limit price has been broken.
+
+    A buy order's limit is broken when the price is at or below it and its
+    stop is broken when the price is at or above it. Sell orders are the
+    reverse. A price that is NaN is never broken.
+
+    :param stop: The stop price of each order.
+    :param limit: The limit price of each order.
+    :param buy: True if the order is a buy order.
+    :param open_mask: True if the slot holds an open order.
+    :param price: The current price of the ticker.
+    :return: A boolean mask of the orders that could be triggered.
+    """
+    with np.errstate(invalid='ignore'):
+        limit_broken = np.where(buy, price <= limit, price >= limit)
+        stop_broken = np.where(buy, price >= stop, price <= stop)
+
+    return open_mask & (limit_broken | stop_broken)
+
+
+def _eval_triggers_loop(stop, limit, buy, open_mask, price):
+    """
+    Same as :func:`_eval_triggers_vectorized` written as a single loop so
+    that numba can compile it without any temporary arrays.
+    """
+    triggered = np.zeros(open_mask.shape[0], dtype=np.bool_)
+
+    for i in range(open_mask.shape[0]):
+        if not open_mask[i]:
+            continue
+        elif buy[i]:
+            triggered[i] = price <= limit[i] or price >= stop[i]
+        else:
+            triggered[i] = price >= limit[i] or price <= stop[i]
+
+    return triggered
+
+
+if numba is not None:
+    eval_triggers = numba.njit(cache=True)(_eval_triggers_loop)
+else:
+    eval_triggers = _eval_triggers_vectorized
+
+
+class TriggerArrays(object):
+    """
+    Hold the trigger prices of all the open orders for a single ticker in
+    parallel arrays.
+
+    Each order gets a slot in the arrays when it is added. Removing an order
+    only clears its slot, the arrays are compacted once more than half of
+    the slots are empty. Compacting keeps the slots in the order they were
+    added.
+
+    The range of prices that cannot trigger any order is cached and only
+    recalculated after an order is added or removed, so a tick whose price
+    falls inside it is skipped without looking at the arrays.
+    """
+
+    INITIAL_SIZE = 8
+
+    # name of the array and the value that an empty slot is filled with.
+    _FIELDS = (
+        ('stop', np.nan),
+        ('limit', np.nan),
+        ('buy', False),
+        ('open_mask', False),
+    )
+
+    def __init__(self):
+        self.stop = np.full(self.INITIAL_SIZE, np.nan, dtype=np.float64)
+        self.limit = np.full(self.INITIAL_SIZE, np.nan, dtype=np.float64)
+        self.buy = np.zeros(self.INITIAL_SIZE, dtype=bool)
+        self.open_mask = np.zeros(self.INITIAL_SIZE, dtype=bool)
+        # slot -> order, None if the slot has been cleared.
+        self.orders = []
+        # order_id -> slot
+        self._slots = {}
+        # (lower, upper) price bounds, None when orders have changed.
+        self._bounds = None
+
+    def __len__(self):
+        return len(self._slots)
+
+    def add(self, order) -> None:
+        """
+        Add an order to the next free slot.
+
+        Market orders are stored with an infinite limit price so that
+        they are triggered by any price that is not NaN.
+        """
+        slot = len(self.orders)
+
+        if slot == len(self.open_mask):
+            self._resize(slot * 2)
+
+        is_buy = order.action is TradeAction.BUY
+
+        if order.order_type is OrderType.MARKET:
+            self.limit[slot] = np.inf if is_buy else -np.inf
+        else:
+            self.limit[slot] = getattr(order, 'limit_price', np.nan)
+            self.stop[slot] = getattr(order, 'stop_price', np.nan)
+
+        self.buy[slot] = is_buy
+        self.open_mask[slot] = True
+        self.orders.append(order)
+        self._slots[order.id] = slot
+        self._bounds = None
+
+    def mark_triggered(self, order) -> None:
+        """
+        Store an order that has been triggered the same way as a market order.
+
+        Once an order is triggered it stays triggered until it is filled, so
+        it must keep being returned even if the price moves back across its
+        stop or limit.
+        """
+        slot = self._slots.get(order.id)
+
+        if slot is None:
+            return
+
+        self.limit[slot] = np.inf if self.buy[slot] else -np.inf
+        self._bounds = None
+
+    def remove(self, order) -> None:
+        """Clear the slot of an order if it has one."""
+        slot = self._slots.pop(order.id, None)
+
+        if slot is None:
+            return
+
+        for name, empty in self._FIELDS:
+            getattr(self, name)[slot] = empty
+
+        self.orders[slot] = None
+        self._bounds = None
+
+        if len(self._slots) < len(self.orders) // 2:
+            self._compact()
+
+    def triggered(self, price: float) -> List:
+        """
+        Return the orders that ``price`` could trigger in the order that they
+        were added.
+        """
+        if self._bounds is None:
+            self._bounds = self._price_bounds()
+
+        lower, upper = self._bounds
+
+        if lower < price < upper:
+            return []
+
+        n = len(self.orders)
+        mask = eval_triggers(self.stop[:n], self.limit[:n], self.buy[:n],
+                             self.open_mask[:n], price)
+        return [self.orders[i] for i in np.flatnonzero(mask)]
+
+    def _price_bounds(self):
+        """
+        Return the open interval of prices that cannot trigger any order.
+
+        Buy limits and sell stops are broken at or below their price so the
+        highest of them is the lower bound. Sell limits and buy stops are
+        broken at or above their price so the lowest of them is the upper
+        bound.
+
+        Market orders and orders that have already been triggered are stored
+        with an infinite limit, so a buy forces the lower bound to ``inf`` and
+        a sell forces the upper bound to ``-inf`` and the ticker is never
+        skipped while they are open.
+        """
+        n = len(self.orders)
+        buy = self.buy[:n] & self.open_mask[:n]
+        sell = ~self.buy[:n] & self.open_mask[:n]
+        below = np.concatenate((self.limit[:n][buy], self.stop[:n][sell]))
+        above = np.concatenate((self.limit[:n][sell], self.stop[:n][buy]))
+        below = below[~np.isnan(below)]
+        above = above[~np.isnan(above)]
+        lower = below.max() if below.size else -np.inf
+        upper = above.min() if above.size else np.inf
+        return lower, upper
+
+    def _resize(self, size: int) -> None:
+        """Grow the arrays to ``size`` slots."""
+        n = len(self.orders)
+
+        for name, empty in self._FIELDS:
+            old = getattr(self, name)
+            new = np.full(size, empty, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def _compact(self) -> None:
+        """Move all of the open slots to the front of the arrays."""
+        keep = np.flatnonzero(self.open_mask[:len(self.orders)])
+
+        for name, empty in self._FIELDS:
+            old = getattr(self, name)
+            new = np.full(len(old), empty, dtype=old.dtype)
+            new[:len(keep)] = old[keep]
+            setattr(self, name, new)
+
+        self.orders = [self.orders[i] for i in keep]
+        self._slots = {order.id: i for i, order in enumerate(self.orders)}
@@ -1,14 +1,15 @@
-import collections
 import logging
 import operator
 import queue
 from datetime import datetime
 from typing import Dict, Union
 
+import numpy as np
+
 import pytech.utils as utils
 from pytech.backtest.event import TradeEvent
 from pytech.data.handler import DataHandler
-from pytech.fin.asset.asset import Asset
+from pytech.trading._triggers import TriggerArrays
 from pytech.trading.commission import (
     AbstractCommissionModel,
     PerOrderCommissionModel
@@ -40,8 +41,16 @@ class Blotter(object):
                  commission_model=None,
                  max_shares=None):
         self.logger = logging.getLogger(__name__)
-        # dict of all orders. key=ticker of the asset, value=the order.
+        # dict of all open orders.
+        # key=ticker of the asset, value=dict of order_id to the order.
         self.orders = {}
+        # keep a record of all orders that are no longer open, same layout
+        # as ``orders``.
+        self.closed_orders = {}
+        # key=order_id of an open order, value=the ticker it is stored under.
+        self._order_tickers = {}
+        # key=ticker, value=the trigger prices of that ticker's open orders.
+        self._triggers = {}
         # keep a record of all past trades.
         self.trades = []
         self.current_dt = None
@@ -83,25 +92,6 @@ class Blotter(object):
         """Get an order from the orders dict."""
         return self.orders[key]
 
-    def __setitem__(self, key, value):
-        """
-        Add an order to the orders dict.
-        If the key is an instance of :class:`~ticker.Asset` then the ticker is used as the key, otherwise the key is the
-        ticker.
-        :param key: The key to dictionary, will always be the ticker of the ``Asset`` the order is for but an instance
-        of :class:`~ticker.Asset` will also work as long as the ticker is set.
-        :type key: Asset or str
-        :param Order value: The order.
-        """
-        if issubclass(key.__class__, Asset):
-            self.orders[key.ticker] = value
-        else:
-            self.orders[key] = value
-
-    def __delitem__(self, key):
-        """Delete an order from the orders dict."""
-        del self.orders[key]
-
     def __iter__(self):
         """
         Iterate over the orders dict as well as the nested orders dict which
@@ -110,15 +100,15 @@ class Blotter(object):
         This means you can iterate over a :class:``Blotter`` instance directly
         and access all of the open orders it has.
         """
+        for asset_orders in self.orders.values():
+            for order_id, order in asset_orders.items():
+                # skip orders that were closed directly on the ``Order``.
+                if order.open:
+                    yield order_id, order
 
-        def do_iter(orders_dict):
-            for k, v in orders_dict.items():
-                if isinstance(v, collections.Mapping):
-                    yield from do_iter(v)
-                else:
-                    yield k, v
-
-        return do_iter(self.orders)
+    def __len__(self):
+        """Return the number of open orders."""
+        return sum(1 for _ in self)
 
     def place_order(self,
                     ticker: str,
@@ -203,14 +193,13 @@ class Blotter(object):
                                    max_days_open=max_days_open,
                                    **kwargs)
 
-        if ticker in self.orders:
-            self.orders[ticker].update({
-                order.id: order
-            })
-        else:
-            self.orders[ticker] = {
-                order.id: order
-            }
+        self.orders.setdefault(order.ticker, {})[order.id] = order
+        self._order_tickers[order.id] = order.ticker
+
+        if order.ticker not in self._triggers:
+            self._triggers[order.ticker] = TriggerArrays()
+
+        self._triggers[order.ticker].add(order)
 
     def _create_order(self,
                       ticker: str,
@@ -238,14 +227,43 @@ class Blotter(object):
             return StopLimitOrder(ticker, action, qty, **kwargs)
 
     def _find_order(self, order_id, ticker):
+        """
+        Return an open or closed order.
+
+        :raises KeyError: If the blotter has no order with ``order_id``.
+        """
         if ticker is None:
-            for asset_orders in self.orders:
-                if order_id in asset_orders:
-                    return asset_orders[order_id]
-        else:
-            for k, v in self.orders[ticker].items():
-                if k == order_id:
-                    return v
+            ticker = self._order_tickers.get(order_id)
+
+        order = self.orders.get(ticker, {}).get(order_id)
+
+        if order is not None:
+            return order
+
+        if ticker is None:
+            # closed orders are not in _order_tickers.
+            for closed in self.closed_orders.values():
+                if order_id in closed:
+                    return closed[order_id]
+        elif order_id in self.closed_orders.get(ticker, {}):
+            return self.closed_orders[ticker][order_id]
+
+        raise KeyError(f'Order id: {order_id} for ticker: {ticker} '
+                       f'does not exist in the blotter.')
+
+    def _already_closed(self, order, action):
+        """
+        Return True and make sure ``order`` is in ``closed_orders`` if it
+        is not open, so that its status is not overwritten.
+        """
+        if order.open:
+            return False
+
+        self.logger.warning(
+                f'Order id: {order.id} for ticker: {order.ticker} is already '
+                f'{order.status.name} and cannot be {action}.')
+        self._close_order(order)
+        return True
 
     def cancel_order(self, order_id, ticker=None, reason=''):
         """
@@ -253,15 +271,15 @@ class Blotter(object):
 
         :param str order_id: The id of the order to cancel.
         :param ticker: (optional) The ticker that the order is associated with.
-            Although it is not required to provide a ticker,
-            it is **strongly** encouraged.
-            By providing a ticker the execution time of this method will
-            increase greatly.
+            If it is not provided it will be looked up from the ``order_id``.
         :param str reason: (optional)
             The reason that the order is being cancelled.
-        :return:
+        :raises KeyError: If the blotter has no order with ``order_id``.
         """
-        self._do_order_cancel(self._find_order(order_id, ticker), reason)
+        order = self._find_order(order_id, ticker)
+
+        if not self._already_closed(order, 'canceled'):
+            self._do_order_cancel(order, reason)
 
     def cancel_all_orders_for_asset(self, ticker,
                                     reason='',
@@ -284,9 +302,12 @@ class Blotter(object):
         :param TradeAction trade_action: (optional) Only cancel orders that are
         either ``BUY`` or ``SELL``.
         """
-        for order in self.orders[ticker].values():
-            if self._check_filters(order, upper_price, lower_price,
-                                   order_type, trade_action):
+        # cancelling moves the order out of the open bucket.
+        for order in list(self.orders.get(ticker, {}).values()):
+            if not order.open:
+                self._close_order(order)
+            elif self._check_filters(order, upper_price, lower_price,
+                                     order_type, trade_action):
                 self._do_order_cancel(order, reason)
 
     def _check_filters(self,
@@ -431,6 +452,27 @@ class Blotter(object):
                              'successfully before it was executed.')
         order.cancel(reason)
         order.last_updated = self.current_dt
+        self._close_order(order)
+
+    def _close_order(self, order: AnyOrder):
+        """
+        Move an order from the open orders bucket to the closed orders bucket.
+
+        Keeping the buckets separate means that only open orders are ever
+        walked when checking for triggers.
+        """
+        ticker_orders = self.orders.get(order.ticker, {})
+        ticker_orders.pop(order.id, None)
+        self._order_tickers.pop(order.id, None)
+
+        if order.ticker in self._triggers:
+            self._triggers[order.ticker].remove(order)
+
+        if not ticker_orders:
+            self.orders.pop(order.ticker, None)
+            self._triggers.pop(order.ticker, None)
+
+        self.closed_orders.setdefault(order.ticker, {})[order.id] = order
 
     def hold_order(self, order):
         """
@@ -438,7 +480,10 @@ class Blotter(object):
 
         :param order:
         """
-        self.orders[order.ticker][order.id].status = OrderStatus.HELD
+        open_order = self.orders.get(order.ticker, {}).get(order.id)
+
+        if open_order is not None and open_order.open:
+            open_order.status = OrderStatus.HELD
 
     def hold_all_orders_for_asset(self, ticker: str,
                                   upper_price: float = None,
@@ -458,9 +503,12 @@ class Blotter(object):
         :param trade_action: (optional) Only hold orders that are
         either ``BUY`` or ``SELL``.
         """
-        for order in self.orders[ticker].values():
-            if self._check_filters(order, upper_price, lower_price,
-                                   order_type, trade_action):
+        # closing an order moves it out of the open bucket.
+        for order in list(self.orders.get(ticker, {}).values()):
+            if not order.open:
+                self._close_order(order)
+            elif self._check_filters(order, upper_price, lower_price,
+                                     order_type, trade_action):
                 self.hold_order(order)
 
     def reject_order(self, order_id, ticker=None, reason=''):
@@ -475,10 +523,16 @@ class Blotter(object):
         :param str ticker: (optional)
             The ticker associated with the order being rejected.
         :param str reason: (optional) The reason the order was rejected.
-        :return:
+        :raises KeyError: If the blotter has no order with ``order_id``.
         """
 
-        self._find_order(order_id, ticker).reject(reason)
+        order = self._find_order(order_id, ticker)
+
+        if self._already_closed(order, 'rejected'):
+            return
+
+        order.reject(reason)
+        self._close_order(order)
 
         self.logger.warning(
                 f'Order id: {order_id} for ticker: {ticker} '
@@ -488,18 +542,50 @@ class Blotter(object):
         """
         Check if any order has been triggered and if they have execute the
         trade and then clean up closed orders.
-        """
-        for order_id, order in self:
+
+        The stop and limit prices of every open order are checked against
+        the current price in one vectorized pass per ticker and only the
+        orders that could have been triggered have ``check_triggers``
+        called on them.
+
+        A bar without a close price triggers nothing for its ticker, not
+        even market orders, because there is no price to fill them at. The
+        orders are checked again on the next bar.
+
+        Orders should be closed through the blotter, e.g.
+        :func:`cancel_order`. An order closed directly on the ``Order``
+        itself, e.g. by ``check_order_expiration``, is never triggered or
+        acted on again. It is moved to ``closed_orders`` the next time the
+        blotter comes across it.
+        """
+        # closing an order can remove its ticker from the dict.
+        for ticker, trigger_arrays in list(self._triggers.items()):
+            # every order for a ticker is checked against the same bar so
+            # only look it up once per ticker.
             # should this be looking the close column?
-            bar = self.bars.get_latest_bar(order.ticker)
+            bar = self.bars.get_latest_bar(ticker)
             dt = bar.name
             current_price = bar[utils.CLOSE_COL]
             # available_volume = bar[pd_utils.VOL_COL]
-            # check_triggers returns a boolean indicating if it is triggered.
-            if order.check_triggers(dt=dt, current_price=current_price):
-                self.events.put(
-                        TradeEvent(order_id, current_price, order.qty, dt)
-                )
+
+            if np.isnan(current_price):
+                continue
+
+            for order in trigger_arrays.triggered(current_price):
+                if not order.open:
+                    # the order was closed directly instead of through the
+                    # blotter.
+                    self._close_order(order)
+                # check_triggers returns a boolean indicating if it is
+                # triggered.
+                elif order.check_triggers(dt=dt,
+                                          current_price=current_price):
+                    # keep firing until the order is filled even if the
+                    # price moves back across the trigger.
+                    trigger_arrays.mark_triggered(order)
+                    self.events.put(
+                            TradeEvent(order.id, current_price, order.qty, dt)
+                    )
 
     def make_trade(self,
                    order: AnyOrder,
@@ -544,15 +630,8 @@ class Blotter(object):
 
         order.filled += trade.qty
         self.trades.append(trade)
-        return trade
 
-    def purge_orders(self):
-        """Remove any order that is no longer open."""
-        open_orders = {}
+        if not order.open:
+            self._close_order(order)
 
-        for ticker, asset_orders in self.orders:
-            for order in asset_orders:
-                if order.open and order.open_amount != 0:
-                    open_orders[ticker] = order
-
-        self.orders = open_orders
+        return trade
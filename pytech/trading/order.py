@@ -133,7 +133,9 @@ class Order(metaclass=ABCMeta):
     @property
     def ticker(self):
         """Make ticker always return the ticker unless directly accessed."""
-        if issubclass(self._ticker.__class__, Asset):
+        if type(self._ticker) is str:
+            return self._ticker
+        elif issubclass(self._ticker.__class__, Asset):
             return self._ticker.ticker
         else:
             return self._ticker
@@ -361,7 +363,8 @@ class LimitOrder(Order):
         if self.action is TradeAction.BUY and current_price <= self.limit_price:
             self.limit_reached = True
             self.last_updated = dt
-        elif current_price >= self.limit_price:
+        elif (self.action is not TradeAction.BUY
+              and current_price >= self.limit_price):
             # The only other actions are SELL and EXIT which are both sell.
             self.limit_reached = True
             self.last_updated = dt
@@ -421,7 +424,8 @@ class StopOrder(Order):
         if self.action is TradeAction.BUY and current_price >= self.stop_price:
             self.stop_reached = True
             self.last_updated = dt
-        elif current_price <= self.stop_price:
+        elif (self.action is not TradeAction.BUY
+              and current_price <= self.stop_price):
             self.stop_reached = True
             self.last_updated = dt
         else:
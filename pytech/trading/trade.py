@@ -19,6 +19,13 @@ class Trade(object):
     """
 
     LOGGER_NAME = 'trade'
+    logger = logging.getLogger(LOGGER_NAME)
+
+    # a Trade is created for every fill and kept for the life of the
+    # blotter so don't give each one a __dict__.
+    __slots__ = ('trade_date', 'action', 'strategy', 'ticker', 'qty',
+                 'price_per_share', 'order', 'commission',
+                 'avg_price_per_share')
 
     def __init__(self, qty, price_per_share, action, strategy, order,
                  avg_price_per_share, commission=0.0,
@@ -65,7 +72,6 @@ class Trade(object):
         self.order = order
         self.commission = commission
         self.avg_price_per_share = avg_price_per_share
-        self.logger = logging.getLogger(self.LOGGER_NAME)
 
     def trade_cost(self):
         """
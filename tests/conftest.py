@@ -10,8 +10,9 @@ from pytech import TEST_DATA_DIR
 from pytech.data.handler import Bars
 from pytech.fin.portfolio import BasicPortfolio
 from pytech.fin.handler import BasicSignalHandler
-from pytech.mongo import ARCTIC_STORE
+from pytech.mongo import ARCTIC_STORE, init_db
 
+init_db()
 lib = ARCTIC_STORE['pytech.bars']
 
 
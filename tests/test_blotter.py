@@ -1,7 +1,59 @@
+import queue
+
+import pandas as pd
+import pytest
+
+import pytech.trading.blotter as b
 import pytech.trading.order as ord
+import pytech.utils.dt_utils as dt_utils
+import pytech.utils.pandas_utils as pd_utils
+from pytech.data.handler import DataHandler
 from pytech.utils.enums import OrderStatus, OrderType, TradeAction
 
 
+class StubBars(DataHandler):
+    """A :class:`DataHandler` that serves close prices set by the test."""
+
+    # noinspection PyMissingConstructor
+    def __init__(self):
+        self.dt = None
+        self.prices = {}
+
+    def set_bar(self, dt, **prices):
+        self.dt = dt_utils.parse_date(dt)
+        self.prices = prices
+
+    def get_latest_bar(self, ticker):
+        return pd.Series({pd_utils.CLOSE_COL: self.prices[ticker]},
+                         name=self.dt)
+
+    def get_latest_bars(self, ticker, n=1):
+        raise NotImplementedError
+
+    def get_latest_bar_dt(self, ticker):
+        return self.dt
+
+    def get_latest_bar_value(self, ticker, val_type, n=1):
+        raise NotImplementedError
+
+    def update_bars(self):
+        raise NotImplementedError
+
+    def _populate_ticker_data(self):
+        raise NotImplementedError
+
+
+def fired(events):
+    """Return the order id and price of every queued ``TradeEvent``."""
+    trades = []
+
+    while not events.empty():
+        event = events.get(False)
+        trades.append((event.order_id, event.price))
+
+    return trades
+
+
 class TestBlotter(object):
     def test_place_order(self, blotter):
 
@@ -15,6 +67,9 @@ class TestBlotter(object):
         for k, v in blotter:
             assert isinstance(v, ord.Order)
 
+        assert len(blotter) == 3
+        assert {k for k, v in blotter} == {'one', 'three', 'four'}
+
     def test_cancel_order(self, populated_blotter):
         """
         Test canceling orders.
@@ -25,9 +80,44 @@ class TestBlotter(object):
 
         populated_blotter.cancel_order('one', 'AAPL')
 
+        order = populated_blotter.closed_orders['AAPL']['one']
+        assert order.status is OrderStatus.CANCELLED
+
         for k, v in populated_blotter:
-            if k == 'one':
-                assert v.status is OrderStatus.CANCELLED
+            assert k != 'one'
+
+    def test_cancel_order_without_ticker(self, populated_blotter):
+        """
+        Test canceling an order by id only.
+
+        :param populated_blotter:
+        :type populated_blotter: blotter.Blotter
+        """
+        populated_blotter.cancel_order('three')
+
+        assert 'MSFT' not in populated_blotter.orders
+        order = populated_blotter.closed_orders['MSFT']['three']
+        assert order.status is OrderStatus.CANCELLED
+
+    def test_cancel_order_twice(self, populated_blotter):
+        """
+        Test that acting on a closed order leaves its status alone.
+
+        :param populated_blotter:
+        :type populated_blotter: blotter.Blotter
+        """
+        populated_blotter.cancel_order('one', reason='first')
+        populated_blotter.cancel_order('one', reason='second')
+        populated_blotter.reject_order('one')
+
+        order = populated_blotter.closed_orders['AAPL']['one']
+        assert order.status is OrderStatus.CANCELLED
+        assert order.reason == 'first'
+        assert len(populated_blotter) == 3
+
+    def test_cancel_unknown_order(self, populated_blotter):
+        with pytest.raises(KeyError):
+            populated_blotter.cancel_order('five')
 
     def test_cancel_all_orders_for_asset(self, populated_blotter):
         """
@@ -39,9 +129,60 @@ class TestBlotter(object):
 
         populated_blotter.cancel_all_orders_for_asset('AAPL')
 
-        for k, order in populated_blotter:
-            if order.ticker == 'AAPL':
-                assert order.status is OrderStatus.CANCELLED
+        closed_aapl = populated_blotter.closed_orders['AAPL']
+        assert len(closed_aapl) == 2
+
+        for order in closed_aapl.values():
+            assert order.status is OrderStatus.CANCELLED
+
+    def test_cancel_moves_order_to_closed(self, populated_blotter):
+        """
+        Test that canceled orders leave the open orders bucket.
+
+        :param populated_blotter:
+        :type populated_blotter: blotter.Blotter
+        """
+        populated_blotter.cancel_all_orders_for_asset('AAPL')
+
+        assert 'AAPL' not in populated_blotter.orders
+        assert set(populated_blotter.closed_orders['AAPL']) == {'one', 'two'}
+        assert 'MSFT' in populated_blotter.orders
+
+    def test_actions_on_closed_ticker(self, populated_blotter):
+        """
+        Test that acting on a ticker with no open orders does nothing.
+
+        :param populated_blotter:
+        :type populated_blotter: blotter.Blotter
+        """
+        populated_blotter.cancel_all_orders_for_asset('AAPL')
+        order = populated_blotter.closed_orders['AAPL']['one']
+
+        populated_blotter.cancel_all_orders_for_asset('AAPL')
+        populated_blotter.hold_all_orders_for_asset('AAPL')
+        populated_blotter.hold_order(order)
+
+        assert order.status is OrderStatus.CANCELLED
+
+    def test_order_closed_directly(self, populated_blotter):
+        """
+        Test that an order closed on the ``Order`` itself is not treated as
+        open by the blotter.
+
+        :param populated_blotter:
+        :type populated_blotter: blotter.Blotter
+        """
+        populated_blotter['AAPL']['one'].reject('broker')
+
+        assert len(populated_blotter) == 3
+        assert 'one' not in {k for k, v in populated_blotter}
+
+        populated_blotter.hold_all_orders_for_asset('AAPL')
+        populated_blotter.cancel_all_orders_for_asset('AAPL')
+
+        closed_aapl = populated_blotter.closed_orders['AAPL']
+        assert closed_aapl['one'].status is OrderStatus.REJECTED
+        assert closed_aapl['two'].status is OrderStatus.CANCELLED
 
     def test_create_order(self, blotter):
         stop_order = blotter._create_order('AAPL', TradeAction.BUY,
@@ -85,3 +226,92 @@ class TestBlotter(object):
 
         both_none = blotter._filter_on_price(order, None, None)
         assert both_none is False
+
+
+class TestOrderTriggers(object):
+    """Test checking triggers and filling orders through the blotter."""
+
+    def test_check_order_triggers(self):
+        events = queue.Queue()
+        blotter = b.Blotter(events)
+        blotter.bars = bars = StubBars()
+        blotter.place_order('AAPL', 50, 'BUY', 'LIMIT', limit_price=100.00,
+                            order_id='one')
+        blotter.place_order('MSFT', 50, 'SELL', 'STOP', stop_price=90.00,
+                            order_id='two')
+
+        bars.set_bar('2016-03-10', AAPL=101.00, MSFT=95.00)
+        blotter.check_order_triggers()
+        assert fired(events) == []
+
+        bars.set_bar('2016-03-11', AAPL=99.00, MSFT=95.00)
+        blotter.check_order_triggers()
+        assert fired(events) == [('one', 99.00)]
+
+        # a triggered order keeps firing until it is filled.
+        bars.set_bar('2016-03-14', AAPL=101.00, MSFT=89.00)
+        blotter.check_order_triggers()
+        assert fired(events) == [('one', 101.00), ('two', 89.00)]
+
+    def test_closed_candidate(self):
+        events = queue.Queue()
+        blotter = b.Blotter(events)
+        blotter.bars = bars = StubBars()
+        blotter.place_order('AAPL', 50, 'BUY', 'LIMIT', limit_price=100.00,
+                            order_id='one')
+        blotter['AAPL']['one'].cancel('expired')
+
+        bars.set_bar('2016-03-10', AAPL=99.00)
+        blotter.check_order_triggers()
+
+        assert fired(events) == []
+        assert 'AAPL' not in blotter.orders
+        assert 'AAPL' not in blotter._triggers
+        assert blotter.closed_orders['AAPL']['one'].reason == 'expired'
+
+    def test_no_close_price(self):
+        events = queue.Queue()
+        blotter = b.Blotter(events)
+        blotter.bars = bars = StubBars()
+        blotter.place_order('CVS', 50, 'BUY', 'MARKET')
+        order_id = next(iter(blotter['CVS']))
+
+        bars.set_bar('2016-03-10', CVS=float('nan'))
+        blotter.check_order_triggers()
+        assert fired(events) == []
+
+        bars.set_bar('2016-03-11', CVS=80.00)
+        blotter.check_order_triggers()
+        assert fired(events) == [(order_id, 80.00)]
+
+    def test_make_trade(self):
+        events = queue.Queue()
+        blotter = b.Blotter(events)
+        blotter.bars = bars = StubBars()
+        blotter.place_order('AAPL', 50, 'BUY', 'LIMIT', limit_price=100.00,
+                            order_id='one')
+        blotter.place_order('MSFT', 50, 'SELL', 'STOP', stop_price=90.00,
+                            order_id='two')
+
+        bars.set_bar('2016-03-10', AAPL=99.00, MSFT=95.00)
+        blotter.check_order_triggers()
+        assert fired(events) == [('one', 99.00)]
+
+        order = blotter['AAPL']['one']
+        blotter.make_trade(order, 99.00, bars.dt, volume=20)
+
+        assert order.open
+        assert 'one' in blotter.orders['AAPL']
+
+        blotter.make_trade(order, 99.00, bars.dt, volume=100)
+
+        assert order.status is OrderStatus.FILLED
+        assert 'AAPL' not in blotter.orders
+        assert 'AAPL' not in blotter._triggers
+        assert blotter.closed_orders['AAPL']['one'] is order
+        assert [trade.qty for trade in blotter.trades] == [20, 30]
+        assert len(blotter) == 1
+
+        bars.set_bar('2016-03-11', AAPL=99.00, MSFT=95.00)
+        blotter.check_order_triggers()
+        assert fired(events) == []
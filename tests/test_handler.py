@@ -75,6 +75,38 @@ class TestYahooDataHandler(object):
         with pytest.raises(KeyError):
             yahoo_data_handler.get_latest_bar_value('FAKE', pd_utils.OPEN_COL)
 
+    def test_get_latest_bar_value_n(self, yahoo_data_handler):
+        """
+        Test getting more than one value and that they are a copy.
+
+        :param Bars yahoo_data_handler:
+        """
+        # only one bar is available so far.
+        aapl_close = yahoo_data_handler.get_latest_bar_value(
+                'AAPL', pd_utils.CLOSE_COL, n=2)
+        assert aapl_close == approx([101.17])
+
+        yahoo_data_handler.update_bars()
+
+        aapl_close = yahoo_data_handler.get_latest_bar_value(
+                'AAPL', pd_utils.CLOSE_COL, n=2)
+        assert aapl_close == approx([101.17, 102.26])
+
+        aapl_close[:] = 0
+        aapl_close = yahoo_data_handler.get_latest_bar_value(
+                'AAPL', pd_utils.CLOSE_COL, n=2)
+        assert aapl_close == approx([101.17, 102.26])
+
+    def test_get_latest_bar_value_before_update(self, events, ticker_list,
+                                                start_date, end_date):
+        """Test that no values are returned before the first bar."""
+        handler = Bars(events, ticker_list, start_date, end_date)
+        assert handler.ticker_data is not None
+
+        aapl_close = handler.get_latest_bar_value('AAPL', pd_utils.CLOSE_COL,
+                                                  n=3)
+        assert len(aapl_close) == 0
+
     def test_get_latest_bar_dt(self, yahoo_data_handler):
         """
         Test that the latest date returned is correct.
@@ -0,0 +1,40 @@
+import pytech.trading.order as ord
+
+
+class TestCheckTriggers(object):
+    def test_buy_limit_above_limit(self):
+        buy_limit = ord.LimitOrder('AAPL', 'BUY', 50, limit_price=100.00,
+                                   order_id='one')
+
+        assert not buy_limit.check_triggers(current_price=101.00, dt=None)
+        assert buy_limit.check_triggers(current_price=100.00, dt=None)
+
+    def test_buy_stop_below_stop(self):
+        buy_stop = ord.StopOrder('AAPL', 'BUY', 50, stop_price=110.00,
+                                 order_id='one')
+
+        assert not buy_stop.check_triggers(current_price=105.00, dt=None)
+        assert buy_stop.check_triggers(current_price=110.00, dt=None)
+
+    def test_buy_stop_limit_below_stop(self):
+        stop_limit = ord.StopLimitOrder('AAPL', 'BUY', 50, stop_price=110.00,
+                                        limit_price=108.00, order_id='one')
+
+        assert not stop_limit.check_triggers(current_price=105.00, dt=None)
+        assert not stop_limit.stop_reached
+
+        # the stop is hit but the price is still above the limit.
+        assert not stop_limit.check_triggers(current_price=111.00, dt=None)
+        assert stop_limit.stop_reached
+        assert stop_limit.check_triggers(current_price=107.00, dt=None)
+
+    def test_sell_limit_and_stop(self):
+        sell_limit = ord.LimitOrder('AAPL', 'SELL', 50, limit_price=110.00,
+                                    order_id='one')
+        sell_stop = ord.StopOrder('AAPL', 'SELL', 50, stop_price=95.00,
+                                  order_id='two')
+
+        assert not sell_limit.check_triggers(current_price=105.00, dt=None)
+        assert sell_limit.check_triggers(current_price=111.00, dt=None)
+        assert not sell_stop.check_triggers(current_price=100.00, dt=None)
+        assert sell_stop.check_triggers(current_price=94.00, dt=None)
@@ -0,0 +1,108 @@
+import numpy as np
+
+import pytech.trading.order as ord
+from pytech.trading._triggers import (
+    TriggerArrays,
+    _eval_triggers_loop,
+    _eval_triggers_vectorized
+)
+
+
+class TestTriggerArrays(object):
+    def test_triggered(self):
+        trigger_arrays = TriggerArrays()
+        buy_limit = ord.LimitOrder('AAPL', 'BUY', 50, limit_price=100.00,
+                                   order_id='one')
+        sell_limit = ord.LimitOrder('AAPL', 'SELL', 50, limit_price=110.00,
+                                    order_id='two')
+        sell_stop = ord.StopOrder('AAPL', 'SELL', 50, stop_price=95.00,
+                                  order_id='three')
+        market = ord.MarketOrder('AAPL', 'BUY', 50, order_id='four')
+
+        for order in (buy_limit, sell_limit, sell_stop, market):
+            trigger_arrays.add(order)
+
+        assert trigger_arrays.triggered(105.00) == [market]
+        assert trigger_arrays.triggered(99.00) == [buy_limit, market]
+        assert trigger_arrays.triggered(94.00) == [buy_limit, sell_stop,
+                                                   market]
+        assert trigger_arrays.triggered(111.00) == [sell_limit, market]
+
+    def test_remove(self):
+        trigger_arrays = TriggerArrays()
+        orders = [ord.MarketOrder('AAPL', 'BUY', 50, order_id=str(i))
+                  for i in range(TriggerArrays.INITIAL_SIZE + 1)]
+
+        for order in orders:
+            trigger_arrays.add(order)
+
+        for order in orders[:-2]:
+            trigger_arrays.remove(order)
+
+        assert len(trigger_arrays) == 2
+        assert trigger_arrays.triggered(100.00) == orders[-2:]
+
+    def test_bounds_reset(self):
+        trigger_arrays = TriggerArrays()
+        buy_limit = ord.LimitOrder('AAPL', 'BUY', 50, limit_price=100.00,
+                                   order_id='one')
+        trigger_arrays.add(buy_limit)
+
+        assert trigger_arrays.triggered(101.00) == []
+        assert trigger_arrays.triggered(99.00) == [buy_limit]
+
+        trigger_arrays.remove(buy_limit)
+        assert trigger_arrays.triggered(99.00) == []
+
+        market = ord.MarketOrder('AAPL', 'SELL', 50, order_id='two')
+        trigger_arrays.add(market)
+        assert trigger_arrays.triggered(99.00) == [market]
+
+    def test_mark_triggered(self):
+        trigger_arrays = TriggerArrays()
+        buy_stop = ord.StopOrder('AAPL', 'BUY', 50, stop_price=110.00,
+                                 order_id='one')
+        trigger_arrays.add(buy_stop)
+
+        assert trigger_arrays.triggered(111.00) == [buy_stop]
+        assert buy_stop.check_triggers(current_price=111.00, dt=None)
+        trigger_arrays.mark_triggered(buy_stop)
+
+        # the order was not filled and the price fell back below the stop.
+        assert trigger_arrays.triggered(105.00) == [buy_stop]
+
+    def test_bounds_after_trigger(self):
+        trigger_arrays = TriggerArrays()
+        sell_stop = ord.StopOrder('AAPL', 'SELL', 50, stop_price=95.00,
+                                  order_id='one')
+        trigger_arrays.add(sell_stop)
+
+        assert trigger_arrays.triggered(100.00) == []
+        assert trigger_arrays.triggered(94.00) == [sell_stop]
+
+        trigger_arrays.mark_triggered(sell_stop)
+
+        assert trigger_arrays._price_bounds()[1] == -np.inf
+        assert trigger_arrays.triggered(100.00) == [sell_stop]
+
+
+class TestEvalTriggers(object):
+    def test_loop_matches_vectorized(self):
+        nan, inf = np.nan, np.inf
+        stop = np.array([nan, 95.0, 110.0, nan, nan, nan, 90.0, nan, 105.0])
+        limit = np.array([100.0, nan, 108.0, inf, -inf, nan, nan, 100.0,
+                          nan])
+        buy = np.array([True, False, True, True, False, True, False, True,
+                        False])
+        # the last two slots have been cleared.
+        open_mask = np.array([True, True, True, True, True, True, True,
+                              False, False])
+
+        for price in (nan, -inf, 89.0, 95.0, 99.0, 100.0, 105.0, 109.0,
+                      110.0, 111.0, inf):
+            expected = _eval_triggers_vectorized(stop, limit, buy, open_mask,
+                                                 price)
+            actual = _eval_triggers_loop(stop, limit, buy, open_mask, price)
+
+            assert actual.dtype == expected.dtype
+            assert np.array_equal(actual, expected), price